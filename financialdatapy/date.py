@@ -1,10 +1,29 @@
 """This module parses and converts objects to date format objects"""
+import calendar
 from datetime import datetime
 from typing import Union
 import pandas as pd
 from financialdatapy.exception import IntegerDateInputError
 
 
+#: Cache of today's normalized date, keyed by ordinal day so it refreshes
+#: once the calendar day changes.
+_today_cache: tuple[int, pd.Timestamp] = (0, pd.Timestamp.min)
+
+
+def _today() -> pd.Timestamp:
+    """Return date of today at midnight, cached for the rest of the day.
+
+    :return: Current date.
+    :rtype: pandas.Timestamp
+    """
+    global _today_cache
+    day_ordinal = datetime.now().toordinal()
+    if _today_cache[0] != day_ordinal:
+        _today_cache = (day_ordinal, pd.Timestamp.today().normalize())
+    return _today_cache[1]
+
+
 def _convert_none_to_date(start: bool) -> pd.Timestamp:
     """Returns either current date or date 30 days ago.
 
@@ -16,7 +35,7 @@ def _convert_none_to_date(start: bool) -> pd.Timestamp:
     :return: Current date.
     :rtype: pandas.Timestamp
     """
-    today = pd.Timestamp.today().normalize()
+    today = _today()
 
     if start:
         one_month = pd.Timedelta(days=30)
@@ -43,16 +62,40 @@ def validate_date(period: str, start: bool = False) -> pd.Timestamp:
     if period is None:
         date = _convert_none_to_date(start)
     else:
-        try:
-            date_format = '%y-%m-%d'
-            period = datetime.strptime(period, date_format)
-        except ValueError:
-            date_format = '%Y-%m-%d'
-        finally:
-            date = string_to_date(period, date_format)
+        date = _parse_date(period)
     return date
 
 
+def _parse_date(period: str) -> pd.Timestamp:
+    """Parse date in YYYY-MM-DD, YY-MM-DD, or YYYY format into a date object.
+
+    Decodes the digits directly instead of going through
+    :meth:`datetime.strptime`, which interprets a format string on every call.
+    A 2-digit year is assumed to be in the 2000s.
+
+    :param period: Date in string.
+    :type period: str
+    :raises ValueError: If the date is not in a valid format.
+    :return: Parsed date.
+    :rtype: pandas.Timestamp
+    """
+    first_dash = period.find('-')
+
+    if first_dash == -1:
+        year = int(period)
+        month = day = 1
+    else:
+        second_dash = period.find('-', first_dash + 1)
+        year = int(period[:first_dash])
+        month = int(period[first_dash + 1:second_dash])
+        day = int(period[second_dash + 1:])
+
+    if year < 100:
+        year += 2000
+
+    return pd.Timestamp(year, month, day)
+
+
 def string_to_date(period: Union[str, datetime], date_format: str) -> pd.Timestamp:
     """Convert date in string format or datetime object to pandas.Timestamp.
 
@@ -67,17 +110,23 @@ def string_to_date(period: Union[str, datetime], date_format: str) -> pd.Timesta
     return date
 
 
+# Offset of the 'Etc/GMT+4' zone (UTC-04:00) in seconds.
+_GMT_PLUS_4_OFFSET = 4 * 3600
+
+
 def date_to_timestamp(period: pd.Timestamp) -> int:
     """Parse date passed in into a timestamp.
 
+    The date is interpreted in the 'Etc/GMT+4' zone (UTC-04:00). Since the
+    zone is a fixed offset, the timestamp is computed directly from the UTC
+    epoch instead of localizing through a tzinfo object on every call.
+
     :param period: Date object.
     :type period: pandas.Timestamp
     :return: The timestamp value equivalent to the date passed.
     :rtype: int
     """
-
-    date = period.tz_localize(tz='Etc/GMT+4')
-    timestamp = int(date.timestamp())
+    timestamp = calendar.timegm(period.timetuple()) + _GMT_PLUS_4_OFFSET
     return timestamp
 
 
@@ -4,6 +4,14 @@ import pandas as pd
 import re
 from financialdatapy.request import Request
 
+#: Patterns matching financial statement elements in a filing, compiled once
+#: instead of per list element.
+_FILENAME_PATTERN = re.compile(r'r\d', flags=re.I)
+_INCOME_PATTERN = re.compile(r'income|operations?|earnings?', flags=re.I)
+_BALANCE_PATTERN = re.compile(r'balance\ssheets?|financial\sposition',
+                              flags=re.I)
+_CASH_FLOW_PATTERN = re.compile(r'cash\sflows?', flags=re.I)
+
 
 @lru_cache
 def get_filings_list(cik: str) -> pd.DataFrame:
@@ -59,7 +67,7 @@ def get_latest_form(cik: str, latest: str) -> dict:
 
     element = [x.get_text() for x in li]
     filename = [
-        re.search(r'r\d', str(x), flags=re.I).group().upper() for x in li
+        _FILENAME_PATTERN.search(str(x)).group().upper() for x in li
     ]
     file_list = dict(zip(element, filename))
 
@@ -74,11 +82,11 @@ def get_latest_form(cik: str, latest: str) -> dict:
         if any(x in k.lower() for x in ignore):
             continue
 
-        if re.search(r'income|operations?|earnings?', k, flags=re.I):
+        if _INCOME_PATTERN.search(k):
             links['income_statement'] = base_link + v + '.htm'
-        elif re.search(r'balance\ssheets?|financial\sposition', k, flags=re.I):
+        elif _BALANCE_PATTERN.search(k):
             links['balance_sheet'] = base_link + v + '.htm'
-        elif re.search(r'cash\sflows?', k, flags=re.I):
+        elif _CASH_FLOW_PATTERN.search(k):
             links['cash_flow'] = base_link + v + '.htm'
 
     return links
@@ -152,20 +152,15 @@ class Financials(ABC):
             data_table = self._convert_table_header(data_table, row_idx=1)
 
         data_table = data_table.replace(r'-$', '0', regex=True)
-
-        for i in data_table:
-            data_table[i] = pd.to_numeric(data_table[i], errors='coerce')
-
+        data_table = data_table.apply(pd.to_numeric, errors='coerce')
         data_table.dropna(inplace=True)
 
         values_unit = 1_000_000
         data_table = data_table * values_unit
-        ignore_word = ['eps', 'dps']
 
-        for i in data_table.index:
-            for word in ignore_word:
-                if word in i.lower():
-                    data_table.loc[i] /= 1_000_000
+        # per-share rows (eps, dps) are not reported in millions.
+        per_share_row = data_table.index.str.lower().str.contains('eps|dps')
+        data_table.loc[per_share_row] /= values_unit
 
         data_table.index.rename(None, inplace=True)
 
@@ -210,12 +205,6 @@ class UsFinancials(Financials):
     :type period: str, optional
     """
 
-    def __init__(self, symbol: str,
-                 financial: str = 'income_statement',
-                 period: str = 'annual') -> None:
-        """Initializes UsFinancials."""
-        super().__init__(symbol, financial, period)
-
     def _get_latest_filing_info(self) -> tuple[str, pd.Series]:
         """Retrieve latest filing that is submitted either 10-K or 10-Q.
         
@@ -320,11 +309,7 @@ class UsFinancials(Financials):
         financial_statement = financial_statement.fillna('')
 
         financial_statement.iloc[:, 1:] = financial_statement.iloc[:, 1:].apply(
-            lambda x: [
-                ''.join(filter(str.isdigit, i))
-                for i
-                in x
-            ]
+            lambda x: x.str.replace(r'\D', '', regex=True)
         )
 
         return financial_statement
@@ -344,11 +329,6 @@ class KorFinancials(Financials):
     :type api_key: str
     """
 
-    def __init__(self, symbol: str, financial: str = 'income_statement',
-                 period: str = 'annual') -> None:
-        """Initialize KorFinancials"""
-        super().__init__(symbol, financial, period)
-
     def _get_raw_financials(self) -> tuple[pd.DataFrame, str]:
         """Assign period and year according to the user input.
 
@@ -417,38 +397,22 @@ class KorFinancials(Financials):
         :return: Financial statement of a company.
         :rtype: pandas.DataFrame
         """
-        statement = raw_financials[raw_financials['sj_div'] == report_type]
+        is_report = raw_financials['sj_div'] == report_type
 
         if period == 'annual':
-            cols = statement.iloc[0, :].get(
-                [
-                    'sj_nm',
-                    'thstrm_nm',
-                    'frmtrm_nm',
-                    'bfefrmtrm_nm',
-                ]
-            ).to_numpy()
-            statement = statement.get(
-                [
-                    'account_nm',
-                    'thstrm_amount',
-                    'frmtrm_amount',
-                    'bfefrmtrm_amount',
-                ]
-            )
+            header_cols = ['sj_nm', 'thstrm_nm', 'frmtrm_nm', 'bfefrmtrm_nm']
+            value_cols = [
+                'account_nm',
+                'thstrm_amount',
+                'frmtrm_amount',
+                'bfefrmtrm_amount',
+            ]
         else:
-            cols = statement.iloc[0, :].get(
-                [
-                    'sj_nm',
-                    'thstrm_nm'
-                ]
-            ).to_numpy()
-            statement = statement.get(
-                [
-                    'account_nm',
-                    'thstrm_amount'
-                ]
-            )
+            header_cols = ['sj_nm', 'thstrm_nm']
+            value_cols = ['account_nm', 'thstrm_amount']
+
+        cols = raw_financials.loc[is_report, header_cols].iloc[0].to_numpy()
+        statement = raw_financials.loc[is_report, value_cols]
 
         statement.columns = cols
         statement.reset_index(drop=True, inplace=True)
@@ -1,14 +1,68 @@
 """This module handles logic of choosing which stock exchange to search."""
 from datetime import datetime
+from functools import lru_cache
 import pandas as pd
 from typing import Optional
 from financialdatapy.exception import NotAvailable
+from financialdatapy.financials import Financials
 from financialdatapy.financials import KorFinancials
 from financialdatapy.financials import UsFinancials
 from financialdatapy.price import UsMarket
 from financialdatapy.price import KorMarket
 
 
+def _financials_in_exchange(country_code: str, symbol: str,
+                            financial: str, period: str) -> Financials:
+    """Create a :class:`financials.Financials` for a stock exchange.
+
+    :param country_code: Country where the stock is listed.
+    :type country_code: str
+    :param symbol: Symbol of a company/stock.
+    :type symbol: str
+    :param financial: Which financial statement to retrieve.
+    :type financial: str
+    :param period: Either 'annual' or 'quarter'.
+    :type period: str
+    :raises NotAvailable: If the symbol is not listed in the stock exchange.
+    :return: :class:`financials.Financials` of the stock exchange.
+    :rtype: :class:`financials.Financials`
+    """
+    match country_code:
+        case 'USA':
+            return UsFinancials(symbol, financial, period)
+        case 'KOR':
+            return KorFinancials(symbol, financial, period)
+        case _:
+            raise NotAvailable('Symbol is not found.')
+
+
+@lru_cache
+def _get_financial_statement(country_code: str, symbol: str, financial: str,
+                             period: str, is_standard: bool) -> pd.DataFrame:
+    """Retrieve a financial statement, memoized per statement request.
+
+    Repeated calls with the same arguments return the cached statement
+    instead of requesting the source again.
+
+    :param country_code: Country where the stock is listed.
+    :type country_code: str
+    :param symbol: Symbol of a company/stock.
+    :type symbol: str
+    :param financial: Which financial statement to retrieve.
+    :type financial: str
+    :param period: Either 'annual' or 'quarter'.
+    :type period: str
+    :param is_standard: Option for retrieving standard financial statements.
+    :type is_standard: bool
+    :return: Financial statement as reported or standard financial statement.
+    :rtype: pandas.DataFrame
+    """
+    stock = _financials_in_exchange(country_code, symbol, financial, period)
+    if is_standard:
+        return stock.get_standard_financials()
+    return stock.get_financials()
+
+
 class Market:
     """This class represents a stock exchange.
 
@@ -44,20 +98,18 @@ class Market:
         :return: Financials as reported or standard financials or None.
         :rtype: pandas.DataFrame or None
         """
-        match self.country_code:
-            case 'USA':
-                stock = UsFinancials(symbol, financial, period)
-            case 'KOR':
-                stock = KorFinancials(symbol, financial, period)
-            case _:
-                raise NotAvailable('Symbol is not found.')        
         if web:
+            stock = _financials_in_exchange(
+                self.country_code, symbol, financial, period,
+            )
             stock.open_report()
             return
-        if is_standard:
-            return stock.get_standard_financials()
-        else:
-            return stock.get_financials()
+        financial_statement = _get_financial_statement(
+            self.country_code, symbol, financial, period, is_standard,
+        )
+        # hand out a copy so callers mutating their result cannot alter
+        # the cached statement shared by later calls.
+        return financial_statement.copy()
 
     def historical_price(self, symbol: str,
                          start: datetime, end: datetime) -> pd.DataFrame:
@@ -1,10 +1,15 @@
 """This module requests data from web."""
 from bs4 import BeautifulSoup
+import json
 import requests
 from typing import Optional
 from user_agent import generate_user_agent
 from financialdatapy.exception import NotAvailable
 
+#: Session shared by every request, so connections to a data source are
+#: pooled and reused instead of opened per call.
+_session = requests.Session()
+
 
 class Request:
     """A class sending and receiving http request.
@@ -67,11 +72,11 @@ class Request:
         """
 
         if self.method == 'post':
-            res = requests.post(
+            res = _session.post(
                 self.url, data=self.data, headers=self.headers
             )
         else:
-            res = requests.get(
+            res = _session.get(
                 self.url, params=self.params, headers=self.headers
             )
 
@@ -96,7 +101,9 @@ class Request:
             case 'text':
                 return self.response.text
             case 'json':
-                return self.response.json()
+                # decode straight from the raw bytes, skipping the text
+                # property's charset detection pass.
+                return json.loads(self.response.content)
             case 'beautifulsoup':
                 return BeautifulSoup(self.response.text, 'html.parser')
             case _:
@@ -1,12 +1,44 @@
 """This module retrieves financial data of a stock."""
+from concurrent.futures import ThreadPoolExecutor
 from financialdatapy.date import validate_date
 import pandas as pd
-import re
 from typing import Optional
 from financialdatapy.stocklist import KorStockList
 from financialdatapy.exception import CountryCodeValidationFailed
 from financialdatapy.market import Market
 
+#: The three major financial statements.
+_FINANCIAL_STATEMENTS = ('income_statement', 'balance_sheet', 'cash_flow')
+
+#: Alpha-3 country codes assigned in ISO 3166-1.
+_ISO_3166_ALPHA_3 = frozenset((
+    'ABW', 'AFG', 'AGO', 'AIA', 'ALA', 'ALB', 'AND', 'ARE', 'ARG', 'ARM',
+    'ASM', 'ATA', 'ATF', 'ATG', 'AUS', 'AUT', 'AZE', 'BDI', 'BEL', 'BEN',
+    'BES', 'BFA', 'BGD', 'BGR', 'BHR', 'BHS', 'BIH', 'BLM', 'BLR', 'BLZ',
+    'BMU', 'BOL', 'BRA', 'BRB', 'BRN', 'BTN', 'BVT', 'BWA', 'CAF', 'CAN',
+    'CCK', 'CHE', 'CHL', 'CHN', 'CIV', 'CMR', 'COD', 'COG', 'COK', 'COL',
+    'COM', 'CPV', 'CRI', 'CUB', 'CUW', 'CXR', 'CYM', 'CYP', 'CZE', 'DEU',
+    'DJI', 'DMA', 'DNK', 'DOM', 'DZA', 'ECU', 'EGY', 'ERI', 'ESH', 'ESP',
+    'EST', 'ETH', 'FIN', 'FJI', 'FLK', 'FRA', 'FRO', 'FSM', 'GAB', 'GBR',
+    'GEO', 'GGY', 'GHA', 'GIB', 'GIN', 'GLP', 'GMB', 'GNB', 'GNQ', 'GRC',
+    'GRD', 'GRL', 'GTM', 'GUF', 'GUM', 'GUY', 'HKG', 'HMD', 'HND', 'HRV',
+    'HTI', 'HUN', 'IDN', 'IMN', 'IND', 'IOT', 'IRL', 'IRN', 'IRQ', 'ISL',
+    'ISR', 'ITA', 'JAM', 'JEY', 'JOR', 'JPN', 'KAZ', 'KEN', 'KGZ', 'KHM',
+    'KIR', 'KNA', 'KOR', 'KWT', 'LAO', 'LBN', 'LBR', 'LBY', 'LCA', 'LIE',
+    'LKA', 'LSO', 'LTU', 'LUX', 'LVA', 'MAC', 'MAF', 'MAR', 'MCO', 'MDA',
+    'MDG', 'MDV', 'MEX', 'MHL', 'MKD', 'MLI', 'MLT', 'MMR', 'MNE', 'MNG',
+    'MNP', 'MOZ', 'MRT', 'MSR', 'MTQ', 'MUS', 'MWI', 'MYS', 'MYT', 'NAM',
+    'NCL', 'NER', 'NFK', 'NGA', 'NIC', 'NIU', 'NLD', 'NOR', 'NPL', 'NRU',
+    'NZL', 'OMN', 'PAK', 'PAN', 'PCN', 'PER', 'PHL', 'PLW', 'PNG', 'POL',
+    'PRI', 'PRK', 'PRT', 'PRY', 'PSE', 'PYF', 'QAT', 'REU', 'ROU', 'RUS',
+    'RWA', 'SAU', 'SDN', 'SEN', 'SGP', 'SGS', 'SHN', 'SJM', 'SLB', 'SLE',
+    'SLV', 'SMR', 'SOM', 'SPM', 'SRB', 'SSD', 'STP', 'SUR', 'SVK', 'SVN',
+    'SWE', 'SWZ', 'SXM', 'SYC', 'SYR', 'TCA', 'TCD', 'TGO', 'THA', 'TJK',
+    'TKL', 'TKM', 'TLS', 'TON', 'TTO', 'TUN', 'TUR', 'TUV', 'TWN', 'TZA',
+    'UGA', 'UKR', 'UMI', 'URY', 'USA', 'UZB', 'VAT', 'VCT', 'VEN', 'VGB',
+    'VIR', 'VNM', 'VUT', 'WLF', 'WSM', 'YEM', 'ZAF', 'ZMB', 'ZWE',
+))
+
 
 class Stock:
     """A class representing a stock or a company.
@@ -80,32 +112,27 @@ class Stock:
         :return: Company code
         :rtype: str
         """
-        try:
-            isinstance(int(symbol), int)
-        except ValueError:
-            return KorStockList.search_stock_code(symbol)
-        else:
+        if symbol.isdigit():
             return symbol
+        return KorStockList.search_stock_code(symbol)
 
     def _validate_country_code(self, country_code: str) -> str:
         """Validate if country code is in alpha-3 code (ISO 3166).
 
         :param country_code: Country where the stock is listed.
         :type country_code: str
-        :raises CountryCodeValidationFailed: If country code is not
-            in alpha-3 code format.
+        :raises CountryCodeValidationFailed: If country code is not an
+            assigned alpha-3 code.
         :return: Country code in alpha-3 code (ISO-3166).
         :rtype: str
         """
-        try:
-            country_code = re.search(r'\b[a-zA-Z]{3}\b', country_code).group()
+        if isinstance(country_code, str):
             country_code = country_code.upper()
-        except (TypeError, AttributeError):
-            raise CountryCodeValidationFailed(
-                'Country code should be in alpha-3 code (ISO 3166) e.g. USA'
-            )
-        else:
-            return country_code
+            if country_code in _ISO_3166_ALPHA_3:
+                return country_code
+        raise CountryCodeValidationFailed(
+            'Country code should be in alpha-3 code (ISO 3166) e.g. USA'
+        )
 
     def financials(
         self,
@@ -140,6 +167,38 @@ class Stock:
         )
         return financial_statement
 
+    def all_financials(self, period: str = 'annual',
+                       is_standard: bool = False) -> dict[str, pd.DataFrame]:
+        """Get all three major financial statements at once.
+
+        The first statement is fetched up front, then the remaining two are
+        requested concurrently, so retrieving all of them costs about two
+        sequential :meth:`financials` calls instead of three.
+
+        :param period: Either 'annual' or 'quarter', defaults to 'annual'.
+        :type period: str, optional
+        :param is_standard: Option for retrieving standard financial
+            statements, defaults to False.
+        :type is_standard: bool, optional
+        :return: Each financial statement mapped by its name.
+        :rtype: dict[str, pandas.DataFrame]
+        """
+        market = self.market
+
+        def fetch(financial: str) -> pd.DataFrame:
+            return market.financial_statement(
+                self.symbol, financial, period, is_standard, False,
+            )
+
+        # fetch the first statement in the calling thread, so the shared
+        # per-ticker caches (stock list, filings list) fill exactly once
+        # before the worker threads race for them.
+        first, *rest = _FINANCIAL_STATEMENTS
+        statements = [fetch(first)]
+        with ThreadPoolExecutor(max_workers=len(rest)) as executor:
+            statements += executor.map(fetch, rest)
+        return dict(zip(_FINANCIAL_STATEMENTS, statements))
+
     def price(self, start: Optional[str] = None,
               end: Optional[str] = None) -> pd.DataFrame:
         """Get historical stock price data.
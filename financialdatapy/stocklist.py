@@ -1,8 +1,7 @@
 """This module retrieves stock lists."""
 from abc import ABC, abstractmethod
-from functools import cached_property
+from functools import lru_cache
 from io import BytesIO
-import json
 import pandas as pd
 import re
 from string import capwords
@@ -17,9 +16,23 @@ from financialdatapy.request import Request
 class StockList(ABC):
     """Abstract class representing stock list of a stock exchange."""
 
-    @cached_property
+    #: Stock list cache shared by all instances, keyed by exchange class.
+    _cache: dict[type, pd.DataFrame] = {}
+
+    @property
     def stock_list(self) -> pd.DataFrame:
-        return self.get_stock_list()
+        """Stock list of an exchange, fetched lazily on first access.
+
+        The fetched list is memoized per exchange, so repeated lookups in one
+        process reuse it instead of requesting the source again.
+
+        :return: Stock list of an exchange.
+        :rtype: pandas.DataFrame
+        """
+        cls = type(self)
+        if cls not in StockList._cache:
+            StockList._cache[cls] = self.get_stock_list()
+        return StockList._cache[cls]
 
     @abstractmethod
     def get_stock_list(self) -> pd.DataFrame:
@@ -49,15 +62,13 @@ class UsStockList(StockList):
         cik_list = cik_list.reset_index(drop=True)
         cik_list = cik_list.drop('exchange', axis=1)
 
-        cik_list['cik'] = cik_list['cik'].astype(str)
-
         # remove all characters after '\' or '/' in a company name
         # ex) Qualcomm inc\de -> Qualcomm inc
         pattern = r'\s?(\/|\\)[a-zA-Z]*'
         regex = re.compile(pattern, flags=re.I)
-        cik_list['name'] = [regex.sub('', x) for x in cik_list['name']]
-
-        cik_list['name'] = [capwords(x) for x in cik_list['name']]
+        cik_list['name'] = cik_list['name'].str.replace(
+            regex, '', regex=True,
+        ).map(capwords)
 
         return cik_list
 
@@ -71,15 +82,16 @@ class UsStockList(StockList):
         """
         symbol_uppercase = symbol.upper()
         cik_list = self.stock_list
-        symbol_df = cik_list[cik_list['ticker'] == symbol_uppercase]
-        if symbol_df.empty:
+        matched_cik = cik_list.loc[
+            cik_list['ticker'] == symbol_uppercase, 'cik'
+        ]
+        if matched_cik.empty:
             raise EmptyDataFrameError('Cannot search for the symbol.')
-        cik = symbol_df['cik'].item()
+        cik = matched_cik.iat[0]
 
         # cik number received from source excludes 0s that comes first.
         # Since cik is a 10-digit number, concatenate 0s.
-        zeros = 10 - len(str(cik))
-        cik = ('0' * zeros) + str(cik)
+        cik = str(cik).zfill(10)
 
         return cik
 
@@ -99,14 +111,14 @@ class KorStockList(StockList):
         try:
             xml_zip_file = ZipFile(BytesIO(corp_code_file))
             extracted_filename = 'CORPCODE.xml'
-            xml_file = xml_zip_file.read(extracted_filename).decode('utf-8')
-            raw_corp_code = xmltodict.parse(xml_file)
-            encoded_corp_code = json.dumps(raw_corp_code)
-            corp_code_list = json.loads(encoded_corp_code)
+            # feed the zip member to the parser as a stream, so the XML is
+            # never held in memory as one decoded string.
+            with xml_zip_file.open(extracted_filename) as xml_file:
+                raw_corp_code = xmltodict.parse(xml_file)
         except Exception:
             raise DartError('Failed in getting data from Dart.')
         else:
-            corp_code_list = pd.DataFrame(corp_code_list['result']['list'])
+            corp_code_list = pd.DataFrame(raw_corp_code['result']['list'])
             corp_code_list.dropna(inplace=True)
             return corp_code_list
     
@@ -125,9 +137,13 @@ class KorStockList(StockList):
         return corp_code
 
     @staticmethod
+    @lru_cache
     def search_stock_code(comp_name: str) -> str:
         """Search stock code with company name in dart.fss.or.kr.
 
+        Results are cached per company name, so repeated lookups of the same
+        company skip the http request.
+
         :param comp_name: Company name.
         :type comp_name: str
         :return: Stock code.